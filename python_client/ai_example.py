@@ -6,6 +6,7 @@ This script demonstrates how to use the AI Coach to analyze Garmin data
 and provide personalized recommendations.
 """
 
+import asyncio
 import sys
 import os
 from datetime import datetime, timedelta
@@ -17,6 +18,24 @@ from garmin_data_retriever.client import GarminConnectClient
 from garmin_data_retriever.ai_coach import AICoach
 
 
+async def run_analyses(ai_coach, activity, health_data, user_stats, goal):
+    """Run the three coach analyses concurrently on one event loop."""
+    coros = []
+    if activity is not None:
+        coros.append(ai_coach.analyze_activity_async(activity))
+    coros.append(ai_coach.analyze_health_metrics_async(health_data))
+    coros.append(ai_coach.create_training_plan_async(user_stats, goal))
+
+    try:
+        results = await asyncio.gather(*coros)
+    finally:
+        await ai_coach.aclose()
+
+    if activity is None:
+        return [None, *results]
+    return results
+
+
 def main():
     """Main function to demonstrate AI coaching."""
     
@@ -39,47 +58,51 @@ def main():
     print("  (Note: Using Ollama if available, otherwise mock responses)")
     print()
     
-    # Get recent activity
+    # Gather the Garmin data the coach needs
+    activities = garmin_client.get_activities(limit=1)
+    health_data = {
+        "heart_rate": garmin_client.get_heart_rate_data(),
+        "sleep": garmin_client.get_sleep_data(),
+        "stress": garmin_client.get_stress_data()
+    }
+    user_stats = garmin_client.get_user_stats()
+    goal = "Improve 5K running time and build endurance"
+
+    # The three AI calls are independent and I/O-bound, so gather them
+    # on one event loop; with httpx + HTTP/2 they share a single
+    # multiplexed connection to Ollama.
+    activity = activities[0] if activities else None
+    feedback, health_recommendations, training_plan = asyncio.run(
+        run_analyses(ai_coach, activity, health_data, user_stats, goal)
+    )
+
+    # Analyze recent activity
     print("Step 1: Analyzing Recent Activity")
     print("-" * 60)
-    activities = garmin_client.get_activities(limit=1)
-    if activities:
-        activity = activities[0]
-        print(f"Activity: {activity['activityName']}")
-        print(f"Type: {activity['activityType']}")
-        print(f"Distance: {activity['distance'] / 1000:.2f} km")
-        print(f"Duration: {activity['duration'] / 60:.0f} minutes")
+    if activity is not None:
+        print(f"Activity: {activity.activityName}")
+        print(f"Type: {activity.activityType}")
+        print(f"Distance: {activity.distance / 1000:.2f} km")
+        print(f"Duration: {activity.duration / 60:.0f} minutes")
         print()
-        
+
         print("AI Coach Feedback:")
-        feedback = ai_coach.analyze_activity(activity)
         print(feedback)
         print()
-    
+
     # Analyze health metrics
     print("Step 2: Analyzing Health Metrics")
     print("-" * 60)
-    health_data = {
-        "heart_rate": garmin_client.get_heart_rate_data(),
-        "sleep": garmin_client.get_sleep_data(),
-        "stress": garmin_client.get_stress_data()
-    }
-    
     print("AI Coach Health Recommendations:")
-    health_recommendations = ai_coach.analyze_health_metrics(health_data)
     print(health_recommendations)
     print()
-    
+
     # Create training plan
     print("Step 3: Creating Personalized Training Plan")
     print("-" * 60)
-    user_stats = garmin_client.get_user_stats()
-    goal = "Improve 5K running time and build endurance"
-    
     print(f"Goal: {goal}")
     print()
     print("AI Coach Training Plan:")
-    training_plan = ai_coach.create_training_plan(user_stats, goal)
     print(training_plan)
     print()
     
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Ahead-of-time compilation of the numeric kernels.
+
+The example scripts run once and exit, so paying the numba JIT warm-up
+on every invocation would dominate their runtime. Running this script
+builds a `garmin_kernels` extension module which the client imports in
+preference to the JIT path, giving native speed on the first call.
+
+Usage:
+    python compile_kernels.py
+"""
+
+import numpy as np
+from numba.pycc import CC
+
+cc = CC('garmin_kernels')
+
+
+@cc.export('zone_hist', 'i8[:](f4[:], f4[:])')
+def zone_hist(samples, bounds):
+    """Count samples into zones; mirrors client._zone_histogram."""
+    counts = np.zeros(bounds.size, np.int64)
+    for i in range(samples.size):
+        value = samples[i]
+        for zone in range(bounds.size):
+            if value < bounds[zone]:
+                counts[zone] += 1
+                break
+    return counts
+
+
+if __name__ == '__main__':
+    cc.compile()
+    print("Built garmin_kernels extension module")
@@ -11,6 +11,7 @@ This script demonstrates how to:
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 # Add the parent directory to the path so we can import our module
@@ -59,9 +60,15 @@ def main():
     today = datetime.now()
     yesterday = today - timedelta(days=1)
     
-    heart_rate = client.get_heart_rate_data(today)
-    sleep_data = client.get_sleep_data(yesterday)
-    stress_data = client.get_stress_data(today)
+    # The three health fetches are independent API calls, so overlap them
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        heart_rate_future = executor.submit(client.get_heart_rate_data, today)
+        sleep_future = executor.submit(client.get_sleep_data, yesterday)
+        stress_future = executor.submit(client.get_stress_data, today)
+
+        heart_rate = heart_rate_future.result()
+        sleep_data = sleep_future.result()
+        stress_data = stress_future.result()
     
     print("✓ Health metrics retrieved")
     print()
@@ -101,7 +108,7 @@ def main():
         "export_timestamp": datetime.now().isoformat()
     }
     
-    json_output = DataExporter.to_json(all_data, "garmin_data_export.json")
+    DataExporter.to_json(all_data, "garmin_data_export.json")
     print("✓ Data exported to garmin_data_export.json")
     print()
     
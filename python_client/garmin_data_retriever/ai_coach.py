@@ -5,9 +5,144 @@ This module provides AI-powered coaching functionality using a free AI API.
 It analyzes Garmin data and provides personalized coaching recommendations.
 """
 
+import asyncio
+import hashlib
 import json
+import re
+import sys
 import requests
-from typing import Dict, List, Any, Optional
+from collections import defaultdict
+from typing import Dict, Final, List, Any, Optional
+
+from .models import Activity, HeartRateData, SleepData, StressData
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from cachetools import TTLCache
+except ImportError:
+    TTLCache = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# HTTP/2 lets concurrent prompts multiplex over one connection, but
+# needs the optional h2 package; fall back to HTTP/1.1 without it.
+_HTTP2_AVAILABLE = False
+if httpx is not None:
+    try:
+        import h2  # noqa: F401
+        _HTTP2_AVAILABLE = True
+    except ImportError:
+        pass
+
+# orjson parses LLM response chunks several times faster than the
+# stdlib decoder; fall back transparently when it is not installed.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+# Mock responses used when no AI backend is available, allocated once at
+# import; _get_mock_response just returns references to these constants.
+_ACTIVITY_MOCK: Final[str] = """Great workout! Your heart rate data suggests you maintained a good intensity level.
+For improvement, consider adding interval training to boost your cardiovascular fitness.
+Keep monitoring your recovery between sessions."""
+
+_HEALTH_MOCK: Final[str] = """Your health metrics look good overall. Consider these recommendations:
+1. Aim for 7-9 hours of quality sleep to optimize recovery
+2. Practice stress management techniques like meditation or deep breathing
+3. Monitor your resting heart rate trends as an indicator of overall fitness"""
+
+_PLAN_MOCK: Final[str] = """7-Day Training Plan:
+Day 1: Easy run/walk 30 min (recovery pace)
+Day 2: Strength training (upper body focus)
+Day 3: Interval training 40 min
+Day 4: Rest or light yoga
+Day 5: Tempo run 45 min
+Day 6: Strength training (lower body focus)
+Day 7: Long slow distance 60 min
+
+Remember to listen to your body and adjust intensity as needed."""
+
+_DEFAULT_MOCK_RESPONSE: Final[str] = (
+    "Keep up the good work with your training! "
+    "Stay consistent and focus on gradual improvement."
+)
+
+# Dispatch table keyed by prompt category; interned keys make the
+# lookups pointer comparisons in the common case.
+_MOCK_RESPONSES = {
+    sys.intern("activity"): _ACTIVITY_MOCK,
+    sys.intern("health"): _HEALTH_MOCK,
+    sys.intern("training plan"): _PLAN_MOCK,
+}
+
+_MOCK_KEYWORD_RE = re.compile(r"training plan|activity|workout|health|sleep", re.IGNORECASE)
+
+# Synonyms folded onto the canonical response categories above.
+_MOCK_CATEGORY_ALIASES = {"workout": "activity", "sleep": "health"}
+
+
+_M_TO_KM = 1e-3
+_SEC_TO_MIN = 1 / 60
+_SEC_TO_HR = 1 / 3600
+
+
+def _na(value):
+    """Render missing record fields as 'N/A' in prompts."""
+    return "N/A" if value is None else value
+
+
+# Prompt templates, parsed once at import. The builders fill them with
+# format_map instead of reassembling the literals on every call.
+_ACTIVITY_PROMPT_TMPL = """As a personal fitness coach, analyze this workout activity and provide brief feedback:
+
+Activity: {activityName}
+Type: {activityType}
+Distance: {distance_km:.2f} km
+Duration: {duration_min:.0f} minutes
+Average Heart Rate: {averageHR} bpm
+Max Heart Rate: {maxHR} bpm
+Calories: {calories} kcal
+
+Provide concise coaching feedback in 2-3 sentences focusing on:
+1. Performance assessment
+2. One specific recommendation for improvement
+"""
+
+_HEALTH_PROMPT_TMPL = """As a health coach, analyze these daily health metrics and provide brief recommendations:
+
+Heart Rate:
+- Resting: {restingHeartRate} bpm
+- Average: {averageHeartRate} bpm
+
+Sleep:
+- Total: {sleep_hours:.1f} hours
+- Sleep Score: {sleepScore}/100
+
+Stress:
+- Average Level: {averageStressLevel}
+- Rest Time: {restTime} minutes
+
+Provide 2-3 actionable health recommendations based on this data.
+"""
+
+_TRAINING_PLAN_PROMPT_TMPL = """Create a brief weekly training plan for this athlete:
+
+User Profile:
+- Age: {userAge} years
+- Fitness Age: {fitnessAge} years
+- VO2 Max: {vo2Max}
+- Total Activities: {totalActivities}
+
+Goal: {goal}
+
+Provide a concise 7-day training plan with daily recommendations.
+"""
 
 
 class AICoach:
@@ -31,14 +166,47 @@ class AICoach:
         """
         self.api_type = api_type
         self.api_url = api_url
+        self._generate_url = f"{api_url}/api/generate"
+
+        # Reuse one pooled session so sequential AI calls share a
+        # keep-alive connection instead of paying TCP setup per request.
+        self._session = requests.Session()
+        self._session.mount(
+            "http://",
+            requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=4)
+        )
+
+        # Memoize responses for identical prompts so repeated analyses of
+        # the same data skip the expensive inference call. Disabled when
+        # cachetools is not installed.
+        self._cache = TTLCache(maxsize=256, ttl=600) if TTLCache is not None else None
+
+        # Shared httpx client for the async path, created on first use
+        self._async_client = None
+
+    def close(self):
+        """Close the underlying HTTP session."""
+        self._session.close()
+
+    async def aclose(self):
+        """Close the async HTTP client, if one was created."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
-    def analyze_activity(self, activity_data: Dict[str, Any]) -> str:
+    def analyze_activity(self, activity_data: Activity) -> str:
         """
         Analyze an activity and provide coaching feedback.
-        
+
         Args:
-            activity_data: Dictionary containing activity information
-            
+            activity_data: Activity record to analyze
+
         Returns:
             Coaching feedback as a string
         """
@@ -71,61 +239,54 @@ class AICoach:
         """
         prompt = self._create_training_plan_prompt(user_stats, goal)
         return self._get_ai_response(prompt)
-    
-    def _create_activity_prompt(self, activity_data: Dict[str, Any]) -> str:
-        """Create a prompt for activity analysis."""
-        return f"""As a personal fitness coach, analyze this workout activity and provide brief feedback:
 
-Activity: {activity_data.get('activityName')}
-Type: {activity_data.get('activityType')}
-Distance: {activity_data.get('distance', 0) / 1000:.2f} km
-Duration: {activity_data.get('duration', 0) / 60:.0f} minutes
-Average Heart Rate: {activity_data.get('averageHR', 'N/A')} bpm
-Max Heart Rate: {activity_data.get('maxHR', 'N/A')} bpm
-Calories: {activity_data.get('calories', 'N/A')} kcal
+    async def analyze_activity_async(self, activity_data: Activity) -> str:
+        """Async variant of analyze_activity; see that method."""
+        prompt = self._create_activity_prompt(activity_data)
+        return await self._get_ai_response_async(prompt)
 
-Provide concise coaching feedback in 2-3 sentences focusing on:
-1. Performance assessment
-2. One specific recommendation for improvement
-"""
+    async def analyze_health_metrics_async(self, health_data: Dict[str, Any]) -> str:
+        """Async variant of analyze_health_metrics; see that method."""
+        prompt = self._create_health_prompt(health_data)
+        return await self._get_ai_response_async(prompt)
+
+    async def create_training_plan_async(self, user_stats: Dict[str, Any], goal: str) -> str:
+        """Async variant of create_training_plan; see that method."""
+        prompt = self._create_training_plan_prompt(user_stats, goal)
+        return await self._get_ai_response_async(prompt)
     
+    def _create_activity_prompt(self, activity_data: Activity) -> str:
+        """Create a prompt for activity analysis."""
+        return _ACTIVITY_PROMPT_TMPL.format_map({
+            "activityName": activity_data.activityName,
+            "activityType": activity_data.activityType,
+            "distance_km": activity_data.distance * _M_TO_KM,
+            "duration_min": activity_data.duration * _SEC_TO_MIN,
+            "averageHR": _na(activity_data.averageHR),
+            "maxHR": _na(activity_data.maxHR),
+            "calories": _na(activity_data.calories),
+        })
+
     def _create_health_prompt(self, health_data: Dict[str, Any]) -> str:
         """Create a prompt for health metrics analysis."""
-        hr_data = health_data.get('heart_rate', {})
-        sleep_data = health_data.get('sleep', {})
-        stress_data = health_data.get('stress', {})
-        
-        return f"""As a health coach, analyze these daily health metrics and provide brief recommendations:
+        hr_data = health_data.get('heart_rate') or HeartRateData()
+        sleep_data = health_data.get('sleep') or SleepData()
+        stress_data = health_data.get('stress') or StressData()
 
-Heart Rate:
-- Resting: {hr_data.get('restingHeartRate', 'N/A')} bpm
-- Average: {hr_data.get('averageHeartRate', 'N/A')} bpm
-
-Sleep:
-- Total: {sleep_data.get('totalSleepTime', 0) / 3600:.1f} hours
-- Sleep Score: {sleep_data.get('sleepScore', 'N/A')}/100
-
-Stress:
-- Average Level: {stress_data.get('averageStressLevel', 'N/A')}
-- Rest Time: {stress_data.get('restTime', 0)} minutes
+        return _HEALTH_PROMPT_TMPL.format_map({
+            "restingHeartRate": _na(hr_data.restingHeartRate),
+            "averageHeartRate": _na(hr_data.averageHeartRate),
+            "sleep_hours": sleep_data.totalSleepTime * _SEC_TO_HR,
+            "sleepScore": _na(sleep_data.sleepScore),
+            "averageStressLevel": _na(stress_data.averageStressLevel),
+            "restTime": stress_data.restTime,
+        })
 
-Provide 2-3 actionable health recommendations based on this data.
-"""
-    
     def _create_training_plan_prompt(self, user_stats: Dict[str, Any], goal: str) -> str:
         """Create a prompt for training plan generation."""
-        return f"""Create a brief weekly training plan for this athlete:
-
-User Profile:
-- Age: {user_stats.get('userAge')} years
-- Fitness Age: {user_stats.get('fitnessAge')} years
-- VO2 Max: {user_stats.get('vo2Max')}
-- Total Activities: {user_stats.get('totalActivities')}
-
-Goal: {goal}
-
-Provide a concise 7-day training plan with daily recommendations.
-"""
+        view = defaultdict(lambda: None, user_stats)
+        view["goal"] = goal
+        return _TRAINING_PLAN_PROMPT_TMPL.format_map(view)
     
     def _get_ai_response(self, prompt: str) -> str:
         """
@@ -137,57 +298,123 @@ Provide a concise 7-day training plan with daily recommendations.
         Returns:
             AI response as a string
         """
+        if self._cache is not None:
+            key = hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+
         if self.api_type == "ollama":
-            return self._get_ollama_response(prompt)
+            response = self._get_ollama_response(prompt)
         else:
             # Placeholder for other AI APIs
-            return self._get_mock_response(prompt)
+            response = self._get_mock_response(prompt)
+
+        if self._cache is not None:
+            self._cache[key] = response
+
+        return response
     
+    async def _get_ai_response_async(self, prompt: str) -> str:
+        """
+        Async counterpart of _get_ai_response.
+
+        Shares the response cache with the sync path, so mixed callers
+        still deduplicate identical prompts.
+        """
+        if self._cache is not None:
+            key = hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+
+        if self.api_type == "ollama":
+            if httpx is not None:
+                response = await self._get_ollama_response_async(prompt)
+            else:
+                # No httpx installed: still reach Ollama through the
+                # sync requests path, off the event loop.
+                response = await asyncio.to_thread(self._get_ollama_response, prompt)
+        else:
+            response = self._get_mock_response(prompt)
+
+        if self._cache is not None:
+            self._cache[key] = response
+
+        return response
+
+    def _get_async_client(self):
+        """Lazily create the shared httpx client for async calls."""
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                base_url=self.api_url,
+                http2=_HTTP2_AVAILABLE,
+                timeout=30
+            )
+        return self._async_client
+
+    async def _get_ollama_response_async(self, prompt: str) -> str:
+        """Get a streamed response from the Ollama API over httpx.
+
+        Concurrent prompts share one client, so with HTTP/2 they
+        multiplex over a single connection instead of serializing.
+        """
+        try:
+            client = self._get_async_client()
+            async with client.stream(
+                "POST",
+                "/api/generate",
+                json={
+                    "model": "llama2",  # or "mistral", "codellama", etc.
+                    "prompt": prompt,
+                    "stream": True
+                }
+            ) as response:
+                if response.status_code != 200:
+                    return self._get_mock_response(prompt)
+
+                parts = []
+                async for line in response.aiter_lines():
+                    if line:
+                        parts.append(_json_loads(line).get("response", ""))
+                return "".join(parts) or "No response from AI"
+        except Exception as e:
+            print(f"Note: Ollama not available ({e}). Using mock response.")
+            return self._get_mock_response(prompt)
+
     def _get_ollama_response(self, prompt: str) -> str:
         """Get response from Ollama API."""
         try:
-            response = requests.post(
-                f"{self.api_url}/api/generate",
+            with self._session.post(
+                self._generate_url,
                 json={
                     "model": "llama2",  # or "mistral", "codellama", etc.
                     "prompt": prompt,
-                    "stream": False
+                    "stream": True
                 },
+                stream=True,
                 timeout=30
-            )
-            
-            if response.status_code == 200:
-                return response.json().get("response", "No response from AI")
-            else:
-                return self._get_mock_response(prompt)
+            ) as response:
+                if response.status_code != 200:
+                    return self._get_mock_response(prompt)
+
+                # Assemble tokens as they arrive instead of waiting for the
+                # server to buffer the whole completion.
+                parts = []
+                for line in response.iter_lines():
+                    if line:
+                        parts.append(_json_loads(line).get("response", ""))
+                return "".join(parts) or "No response from AI"
         except Exception as e:
             print(f"Note: Ollama not available ({e}). Using mock response.")
             return self._get_mock_response(prompt)
     
     def _get_mock_response(self, prompt: str) -> str:
         """Generate a mock response when AI is not available."""
-        if "activity" in prompt.lower() or "workout" in prompt.lower():
-            return """Great workout! Your heart rate data suggests you maintained a good intensity level. 
-For improvement, consider adding interval training to boost your cardiovascular fitness. 
-Keep monitoring your recovery between sessions."""
-        
-        elif "health" in prompt.lower() or "sleep" in prompt.lower():
-            return """Your health metrics look good overall. Consider these recommendations:
-1. Aim for 7-9 hours of quality sleep to optimize recovery
-2. Practice stress management techniques like meditation or deep breathing
-3. Monitor your resting heart rate trends as an indicator of overall fitness"""
-        
-        elif "training plan" in prompt.lower():
-            return """7-Day Training Plan:
-Day 1: Easy run/walk 30 min (recovery pace)
-Day 2: Strength training (upper body focus)
-Day 3: Interval training 40 min
-Day 4: Rest or light yoga
-Day 5: Tempo run 45 min
-Day 6: Strength training (lower body focus)
-Day 7: Long slow distance 60 min
+        match = _MOCK_KEYWORD_RE.search(prompt)
+        if match is None:
+            return _DEFAULT_MOCK_RESPONSE
 
-Remember to listen to your body and adjust intensity as needed."""
-        
-        else:
-            return "Keep up the good work with your training! Stay consistent and focus on gradual improvement."
+        key = match.group(0).lower()
+        key = _MOCK_CATEGORY_ALIASES.get(key, key)
+        return _MOCK_RESPONSES.get(key, _DEFAULT_MOCK_RESPONSE)
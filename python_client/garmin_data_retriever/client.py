@@ -5,11 +5,137 @@ This module provides a client for interacting with Garmin Connect API
 to retrieve user activity data, health metrics, and other information.
 """
 
+import dataclasses
+import functools
 import json
+import sqlite3
+import time
 import requests
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 
+from .models import Activity, HeartRateData, SleepData, StressData
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+try:
+    # Ahead-of-time compiled kernels (built by compile_kernels.py);
+    # preferred over the JIT path since they have no warm-up cost.
+    import garmin_kernels
+except ImportError:
+    garmin_kernels = None
+
+
+@lru_cache(maxsize=32)
+def _iso_date(date: datetime) -> str:
+    """
+    Format a datetime as YYYY-MM-DD.
+
+    Avoids the strftime format-string parser on every call, and batch
+    pulls over the same dates hit the cache instead of reformatting.
+    """
+    return f"{date.year:04d}-{date.month:02d}-{date.day:02d}"
+
+
+# How long cached API responses stay valid, in seconds
+_CACHE_TTL = 3600
+
+
+def _serialize_record(record) -> bytes:
+    """Serialize a record to JSON bytes for the SQLite cache."""
+    payload = dataclasses.asdict(record)
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode()
+
+
+def _cache_aside(record_type):
+    """
+    Cache a daily-data getter's result in the client's SQLite cache.
+
+    The key combines the method name with the ISO date, so warm lookups
+    are a single indexed SELECT instead of an API round trip. Caching is
+    skipped when no cache is configured, when no explicit date is given,
+    or when extra arguments (e.g. raw samples) are passed.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, date=None, *args, **kwargs):
+            # Enforce the getters' auth contract even on warm lookups;
+            # the cache must not serve data to an unauthenticated client.
+            if not self.is_authenticated:
+                raise Exception("Not authenticated. Call authenticate() first.")
+
+            if self._cache_conn is None or date is None or args or kwargs:
+                return func(self, date, *args, **kwargs)
+
+            key = f"{func.__name__}:{_iso_date(date)}"
+            row = self._cache_conn.execute(
+                "SELECT value, expires FROM api_cache WHERE key = ?", (key,)
+            ).fetchone()
+            now = time.time()
+            if row is not None and row[1] > now:
+                value = orjson.loads(row[0]) if orjson is not None else json.loads(row[0])
+                return record_type(**value)
+
+            result = func(self, date, **kwargs)
+            self._cache_conn.execute(
+                "INSERT OR REPLACE INTO api_cache (key, value, expires) VALUES (?, ?, ?)",
+                (key, _serialize_record(result), now + _CACHE_TTL)
+            )
+            self._cache_conn.commit()
+            return result
+        return wrapper
+    return decorator
+
+
+# Upper BPM bounds for heart rate zones 1-5; the last bound is an open
+# ceiling so every sample lands in a zone.
+_HR_ZONE_BOUNDS = (114.0, 133.0, 152.0, 171.0, float("inf"))
+
+
+def _zone_histogram(samples, bounds):
+    """
+    Count heart rate samples into zones in a single pass.
+
+    Args:
+        samples: 1-D float32 array of per-second BPM samples
+        bounds: 1-D float32 array of ascending zone upper bounds
+
+    Returns:
+        int64 array with one sample count per zone
+    """
+    counts = np.zeros(bounds.size, np.int64)
+    for i in range(samples.size):
+        value = samples[i]
+        for zone in range(bounds.size):
+            if value < bounds[zone]:
+                counts[zone] += 1
+                break
+    return counts
+
+
+if garmin_kernels is not None:
+    _zone_histogram = garmin_kernels.zone_hist
+elif numba is not None:
+    # Compile to native code; cache=True persists the compiled kernel so
+    # later runs skip the JIT warm-up.
+    _zone_histogram = numba.njit(cache=True, fastmath=True)(_zone_histogram)
+
 
 class GarminConnectClient:
     """
@@ -19,19 +145,47 @@ class GarminConnectClient:
     for Garmin Connect authentication and data retrieval.
     """
     
-    def __init__(self, email: Optional[str] = None, password: Optional[str] = None):
+    def __init__(self, email: Optional[str] = None, password: Optional[str] = None,
+                 cache_path: Optional[str] = None):
         """
         Initialize the Garmin Connect client.
-        
+
         Args:
             email: Garmin Connect account email
             password: Garmin Connect account password
+            cache_path: Optional path of a SQLite file used to cache
+                API responses (e.g. "garmin_cache.db"); caching is
+                disabled by default
         """
         self.email = email
         self.password = password
         self.session = None
         self.is_authenticated = False
-        
+
+        self._cache_conn = None
+        if cache_path is not None:
+            # check_same_thread=False so pooled fetches (see example.py)
+            # can share the connection; access is short and GIL-serialized.
+            self._cache_conn = sqlite3.connect(cache_path, check_same_thread=False)
+            self._cache_conn.execute("PRAGMA journal_mode=WAL")
+            self._cache_conn.execute("PRAGMA synchronous=NORMAL")
+            self._cache_conn.execute(
+                "CREATE TABLE IF NOT EXISTS api_cache "
+                "(key TEXT PRIMARY KEY, value BLOB, expires REAL)"
+            )
+
+    def close(self):
+        """Close the cache connection, if one was opened."""
+        if self._cache_conn is not None:
+            self._cache_conn.close()
+            self._cache_conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def authenticate(self) -> bool:
         """
         Authenticate with Garmin Connect.
@@ -47,134 +201,151 @@ class GarminConnectClient:
     
     def get_activities(self, start_date: Optional[datetime] = None, 
                        end_date: Optional[datetime] = None,
-                       limit: int = 10) -> List[Dict[str, Any]]:
+                       limit: int = 10) -> List[Activity]:
         """
         Retrieve activities from Garmin Connect.
-        
+
         Args:
             start_date: Start date for activity retrieval
             end_date: End date for activity retrieval
             limit: Maximum number of activities to retrieve
-            
+
         Returns:
-            List of activity dictionaries
+            List of Activity records
         """
         if not self.is_authenticated:
             raise Exception("Not authenticated. Call authenticate() first.")
-        
+
         # Placeholder data - in real implementation, this would call Garmin API
         activities = [
-            {
-                "activityId": 1,
-                "activityName": "Morning Run",
-                "activityType": "running",
-                "startTime": "2024-01-01T07:00:00",
-                "distance": 5000,  # meters
-                "duration": 1800,  # seconds
-                "averageHR": 145,
-                "maxHR": 165,
-                "calories": 350
-            },
-            {
-                "activityId": 2,
-                "activityName": "Evening Cycle",
-                "activityType": "cycling",
-                "startTime": "2024-01-01T18:00:00",
-                "distance": 15000,  # meters
-                "duration": 3600,  # seconds
-                "averageHR": 130,
-                "maxHR": 155,
-                "calories": 450
-            }
+            Activity(
+                activityId=1,
+                activityName="Morning Run",
+                activityType="running",
+                startTime="2024-01-01T07:00:00",
+                distance=5000,  # meters
+                duration=1800,  # seconds
+                averageHR=145,
+                maxHR=165,
+                calories=350
+            ),
+            Activity(
+                activityId=2,
+                activityName="Evening Cycle",
+                activityType="cycling",
+                startTime="2024-01-01T18:00:00",
+                distance=15000,  # meters
+                duration=3600,  # seconds
+                averageHR=130,
+                maxHR=155,
+                calories=450
+            )
         ]
-        
+
         return activities[:limit]
     
-    def get_heart_rate_data(self, date: Optional[datetime] = None) -> Dict[str, Any]:
+    @_cache_aside(HeartRateData)
+    def get_heart_rate_data(self, date: Optional[datetime] = None,
+                            samples: Optional[Any] = None) -> HeartRateData:
         """
         Retrieve heart rate data for a specific date.
-        
+
         Args:
             date: Date to retrieve heart rate data for (defaults to today)
-            
+            samples: Optional array of per-second BPM samples; when given,
+                the zone minutes are aggregated from it instead of using
+                the placeholder values
+
         Returns:
-            Dictionary containing heart rate data
+            HeartRateData record
         """
         if not self.is_authenticated:
             raise Exception("Not authenticated. Call authenticate() first.")
-        
+
         if date is None:
             date = datetime.now()
-        
-        # Placeholder data
-        return {
-            "date": date.strftime("%Y-%m-%d"),
-            "restingHeartRate": 55,
-            "maxHeartRate": 165,
-            "averageHeartRate": 70,
-            "heartRateZones": {
+
+        if samples is not None and np is not None:
+            counts = _zone_histogram(
+                np.asarray(samples, dtype=np.float32),
+                np.asarray(_HR_ZONE_BOUNDS, dtype=np.float32)
+            )
+            zones = {f"zone{z}": int(counts[z - 1] // 60) for z in range(1, 6)}
+        else:
+            # Placeholder zone minutes
+            zones = {
                 "zone1": 120,  # minutes
                 "zone2": 45,
                 "zone3": 15,
                 "zone4": 5,
                 "zone5": 1
             }
-        }
+
+        # Placeholder data
+        return HeartRateData(
+            date=_iso_date(date),
+            restingHeartRate=55,
+            maxHeartRate=165,
+            averageHeartRate=70,
+            heartRateZones=zones
+        )
     
-    def get_sleep_data(self, date: Optional[datetime] = None) -> Dict[str, Any]:
+    @_cache_aside(SleepData)
+    def get_sleep_data(self, date: Optional[datetime] = None) -> SleepData:
         """
         Retrieve sleep data for a specific date.
-        
+
         Args:
             date: Date to retrieve sleep data for (defaults to yesterday)
-            
+
         Returns:
-            Dictionary containing sleep data
+            SleepData record
         """
         if not self.is_authenticated:
             raise Exception("Not authenticated. Call authenticate() first.")
-        
+
         if date is None:
             date = datetime.now() - timedelta(days=1)
-        
+
         # Placeholder data
-        return {
-            "date": date.strftime("%Y-%m-%d"),
-            "totalSleepTime": 28800,  # seconds (8 hours)
-            "deepSleep": 7200,  # seconds
-            "lightSleep": 18000,  # seconds
-            "remSleep": 3600,  # seconds
-            "awakeTime": 600,  # seconds
-            "sleepScore": 85
-        }
+        return SleepData(
+            date=_iso_date(date),
+            totalSleepTime=28800,  # seconds (8 hours)
+            deepSleep=7200,  # seconds
+            lightSleep=18000,  # seconds
+            remSleep=3600,  # seconds
+            awakeTime=600,  # seconds
+            sleepScore=85
+        )
     
-    def get_stress_data(self, date: Optional[datetime] = None) -> Dict[str, Any]:
+    @_cache_aside(StressData)
+    def get_stress_data(self, date: Optional[datetime] = None) -> StressData:
         """
         Retrieve stress level data for a specific date.
-        
+
         Args:
             date: Date to retrieve stress data for (defaults to today)
-            
+
         Returns:
-            Dictionary containing stress data
+            StressData record
         """
         if not self.is_authenticated:
             raise Exception("Not authenticated. Call authenticate() first.")
-        
+
         if date is None:
             date = datetime.now()
-        
+
         # Placeholder data
-        return {
-            "date": date.strftime("%Y-%m-%d"),
-            "averageStressLevel": 35,
-            "maxStressLevel": 65,
-            "restTime": 180,  # minutes
-            "activityTime": 60,  # minutes
-            "lowStressTime": 480,  # minutes
-            "mediumStressTime": 120,  # minutes
-            "highStressTime": 30  # minutes
-        }
+        return StressData(
+            date=_iso_date(date),
+            averageStressLevel=35,
+            maxStressLevel=65,
+            restTime=180,  # minutes
+            activityTime=60,  # minutes
+            lowStressTime=480,  # minutes
+            mediumStressTime=120,  # minutes
+            highStressTime=30  # minutes
+        )
     
     def get_user_stats(self) -> Dict[str, Any]:
         """
@@ -4,10 +4,48 @@ Data Exporter
 This module provides functionality to export Garmin data in various formats.
 """
 
+import dataclasses
 import json
-from typing import Dict, List, Any
+from typing import List, Any
 from datetime import datetime
 
+from .models import Activity, HeartRateData, SleepData, StressData
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Structure-of-arrays view of the numeric activity fields, so unit
+# conversions run as single vectorized operations instead of per-dict
+# Python arithmetic.
+if np is not None:
+    _ACTIVITY_NUMERIC_DTYPE = np.dtype([('distance', 'f8'), ('duration', 'f8')])
+
+
+# Reciprocals of the unit divisors; multiplying by a preloaded constant
+# is cheaper than dividing per record.
+_M_TO_KM = 1e-3
+_SEC_TO_MIN = 1 / 60
+_SEC_TO_HR = 1 / 3600
+
+
+def _na(value):
+    """Render missing record fields as 'N/A' in the summaries."""
+    return "N/A" if value is None else value
+
+
+def _json_default(obj):
+    """Serialize record classes as plain dicts; stringify anything else."""
+    if dataclasses.is_dataclass(obj):
+        return dataclasses.asdict(obj)
+    return str(obj)
+
 
 class DataExporter:
     """
@@ -22,78 +60,108 @@ class DataExporter:
         Args:
             data: Data to export
             filepath: Optional file path to save JSON
-            
+
         Returns:
-            JSON string
+            The file path when filepath is given, otherwise the JSON string
         """
-        json_str = json.dumps(data, indent=2, default=str)
-        
         if filepath:
-            with open(filepath, 'w') as f:
-                f.write(json_str)
-        
-        return json_str
+            # Write straight to disk so peak memory is the serialized
+            # payload at most, never payload plus a returned copy. The
+            # stdlib path streams incrementally via json.dump.
+            if orjson is not None:
+                with open(filepath, 'wb') as f:
+                    f.write(orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filepath, 'w') as f:
+                    json.dump(data, f, indent=2, default=_json_default)
+            return filepath
+
+        if orjson is not None:
+            # orjson serializes in native code and emits bytes directly,
+            # several times faster than the stdlib encoder for nested
+            # dicts. Dataclass records are handled natively.
+            return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2).decode()
+
+        return json.dumps(data, indent=2, default=_json_default)
     
     @staticmethod
-    def format_activity_summary(activities: List[Dict[str, Any]]) -> str:
+    def format_activity_summary(activities: List[Activity]) -> str:
         """
         Format activities into a human-readable summary.
-        
+
         Args:
-            activities: List of activity dictionaries
-            
+            activities: List of Activity records
+
         Returns:
             Formatted summary string
         """
         if not activities:
             return "No activities found."
-        
-        summary = "Activity Summary\n"
-        summary += "=" * 50 + "\n\n"
-        
-        for i, activity in enumerate(activities, 1):
-            summary += f"Activity {i}: {activity.get('activityName', 'Unknown')}\n"
-            summary += f"  Type: {activity.get('activityType', 'N/A')}\n"
-            summary += f"  Date: {activity.get('startTime', 'N/A')}\n"
-            summary += f"  Distance: {activity.get('distance', 0) / 1000:.2f} km\n"
-            summary += f"  Duration: {activity.get('duration', 0) / 60:.0f} minutes\n"
-            summary += f"  Avg HR: {activity.get('averageHR', 'N/A')} bpm\n"
-            summary += f"  Calories: {activity.get('calories', 'N/A')} kcal\n"
-            summary += "\n"
-        
-        return summary
+
+        # Convert the numeric columns once, vectorized when numpy is
+        # available, instead of doing per-activity arithmetic.
+        if np is not None:
+            arr = np.fromiter(
+                ((a.distance, a.duration) for a in activities),
+                dtype=_ACTIVITY_NUMERIC_DTYPE,
+                count=len(activities)
+            )
+            distances_km = arr['distance'] * _M_TO_KM
+            durations_min = arr['duration'] * _SEC_TO_MIN
+        else:
+            distances_km = [a.distance * _M_TO_KM for a in activities]
+            durations_min = [a.duration * _SEC_TO_MIN for a in activities]
+
+        # Build each activity block in one pass and join once at the end;
+        # repeated += on a shared string degrades to quadratic copying.
+        chunks = [
+            f"Activity {i}: {activity.activityName}\n"
+            f"  Type: {activity.activityType}\n"
+            f"  Date: {activity.startTime}\n"
+            f"  Distance: {km:.2f} km\n"
+            f"  Duration: {mins:.0f} minutes\n"
+            f"  Avg HR: {_na(activity.averageHR)} bpm\n"
+            f"  Calories: {_na(activity.calories)} kcal\n"
+            for i, (activity, km, mins) in enumerate(
+                zip(activities, distances_km, durations_min), 1
+            )
+        ]
+
+        return "Activity Summary\n" + "=" * 50 + "\n\n" + "\n".join(chunks) + "\n"
     
     @staticmethod
-    def format_health_summary(heart_rate: Dict, sleep: Dict, stress: Dict) -> str:
+    def format_health_summary(heart_rate: HeartRateData, sleep: SleepData,
+                              stress: StressData) -> str:
         """
         Format health data into a human-readable summary.
-        
+
         Args:
-            heart_rate: Heart rate data dictionary
-            sleep: Sleep data dictionary
-            stress: Stress data dictionary
-            
+            heart_rate: Heart rate record
+            sleep: Sleep record
+            stress: Stress record
+
         Returns:
             Formatted summary string
         """
-        summary = "Health Summary\n"
-        summary += "=" * 50 + "\n\n"
-        
-        summary += f"Heart Rate Data ({heart_rate.get('date', 'N/A')})\n"
-        summary += f"  Resting HR: {heart_rate.get('restingHeartRate', 'N/A')} bpm\n"
-        summary += f"  Average HR: {heart_rate.get('averageHeartRate', 'N/A')} bpm\n"
-        summary += f"  Max HR: {heart_rate.get('maxHeartRate', 'N/A')} bpm\n\n"
-        
-        summary += f"Sleep Data ({sleep.get('date', 'N/A')})\n"
-        summary += f"  Total Sleep: {sleep.get('totalSleepTime', 0) / 3600:.1f} hours\n"
-        summary += f"  Deep Sleep: {sleep.get('deepSleep', 0) / 3600:.1f} hours\n"
-        summary += f"  Light Sleep: {sleep.get('lightSleep', 0) / 3600:.1f} hours\n"
-        summary += f"  REM Sleep: {sleep.get('remSleep', 0) / 3600:.1f} hours\n"
-        summary += f"  Sleep Score: {sleep.get('sleepScore', 'N/A')}/100\n\n"
-        
-        summary += f"Stress Data ({stress.get('date', 'N/A')})\n"
-        summary += f"  Average Stress: {stress.get('averageStressLevel', 'N/A')}\n"
-        summary += f"  Max Stress: {stress.get('maxStressLevel', 'N/A')}\n"
-        summary += f"  Rest Time: {stress.get('restTime', 0)} minutes\n"
-        
-        return summary
+        # Collect the lines and join once; += on a shared string can
+        # degrade to quadratic copying.
+        parts = [
+            "Health Summary\n",
+            "=" * 50 + "\n\n",
+            f"Heart Rate Data ({heart_rate.date})\n",
+            f"  Resting HR: {_na(heart_rate.restingHeartRate)} bpm\n",
+            f"  Average HR: {_na(heart_rate.averageHeartRate)} bpm\n",
+            f"  Max HR: {_na(heart_rate.maxHeartRate)} bpm\n\n",
+            f"Sleep Data ({sleep.date})\n",
+            f"  Total Sleep: {sleep.totalSleepTime * _SEC_TO_HR:.1f} hours\n",
+            f"  Deep Sleep: {sleep.deepSleep * _SEC_TO_HR:.1f} hours\n",
+            f"  Light Sleep: {sleep.lightSleep * _SEC_TO_HR:.1f} hours\n",
+            f"  REM Sleep: {sleep.remSleep * _SEC_TO_HR:.1f} hours\n",
+            f"  Sleep Score: {_na(sleep.sleepScore)}/100\n\n",
+            f"Stress Data ({stress.date})\n",
+            f"  Average Stress: {_na(stress.averageStressLevel)}\n",
+            f"  Max Stress: {_na(stress.maxStressLevel)}\n",
+            f"  Rest Time: {stress.restTime} minutes\n",
+        ]
+
+        return "".join(parts)
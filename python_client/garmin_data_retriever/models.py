@@ -0,0 +1,59 @@
+"""
+Data Models
+
+Typed record classes for Garmin data. The slotted dataclasses use a
+fixed per-object layout, cutting memory versus free-form dicts with
+repeated string keys and making field access a direct slot lookup.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+
+@dataclass(slots=True, frozen=True)
+class Activity:
+    """A single recorded activity."""
+    activityId: int = 0
+    activityName: str = "Unknown"
+    activityType: str = "N/A"
+    startTime: str = "N/A"
+    distance: float = 0.0  # meters
+    duration: float = 0.0  # seconds
+    averageHR: Optional[int] = None
+    maxHR: Optional[int] = None
+    calories: Optional[int] = None
+
+
+@dataclass(slots=True, frozen=True)
+class HeartRateData:
+    """Daily heart rate metrics."""
+    date: str = "N/A"
+    restingHeartRate: Optional[int] = None
+    maxHeartRate: Optional[int] = None
+    averageHeartRate: Optional[int] = None
+    heartRateZones: Dict[str, int] = field(default_factory=dict)  # minutes per zone
+
+
+@dataclass(slots=True, frozen=True)
+class SleepData:
+    """Nightly sleep metrics."""
+    date: str = "N/A"
+    totalSleepTime: float = 0.0  # seconds
+    deepSleep: float = 0.0  # seconds
+    lightSleep: float = 0.0  # seconds
+    remSleep: float = 0.0  # seconds
+    awakeTime: float = 0.0  # seconds
+    sleepScore: Optional[int] = None
+
+
+@dataclass(slots=True, frozen=True)
+class StressData:
+    """Daily stress metrics."""
+    date: str = "N/A"
+    averageStressLevel: Optional[int] = None
+    maxStressLevel: Optional[int] = None
+    restTime: float = 0.0  # minutes
+    activityTime: float = 0.0  # minutes
+    lowStressTime: float = 0.0  # minutes
+    mediumStressTime: float = 0.0  # minutes
+    highStressTime: float = 0.0  # minutes